@@ -19,6 +19,7 @@ PLAY_SCAN_INTERVAL = 20
 SCAN_INTERVAL = timedelta(seconds=60)
 MIN_TIME_BETWEEN_SCANS = SCAN_INTERVAL
 MIN_TIME_BETWEEN_FORCED_SCANS = timedelta(seconds=1)
+MAX_CONCURRENT_API_CALLS = 8
 
 ALEXA_COMPONENTS = [
     "media_player",
@@ -7,8 +7,11 @@ For more details about this platform, please refer to the documentation at
 https://community.home-assistant.io/t/echo-devices-alexa-as-media-player-testers-needed/58639
 """
 import asyncio
+from datetime import timedelta
+from functools import reduce
 import logging
-import re
+from operator import or_
+import time
 from typing import List, Optional, Text  # noqa pylint: disable=unused-import
 
 from alexapy import AlexaAPI
@@ -38,10 +41,11 @@ from homeassistant.const import (
     STATE_STANDBY,
     STATE_UNAVAILABLE,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.discovery import async_load_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.util import slugify
 
 from . import (
@@ -68,26 +72,56 @@ try:
 except ImportError:
     from homeassistant.components.media_player import MediaPlayerDevice
 
-SUPPORT_ALEXA = (
-    SUPPORT_PAUSE
-    | SUPPORT_PREVIOUS_TRACK
-    | SUPPORT_NEXT_TRACK
-    | SUPPORT_STOP
-    | SUPPORT_VOLUME_SET
-    | SUPPORT_PLAY
-    | SUPPORT_PLAY_MEDIA
-    | SUPPORT_TURN_OFF
-    | SUPPORT_TURN_ON
-    | SUPPORT_VOLUME_MUTE
-    | SUPPORT_PAUSE
-    | SUPPORT_SELECT_SOURCE
-    | SUPPORT_SHUFFLE_SET
+_SUPPORT_FLAGS = (
+    SUPPORT_PAUSE,
+    SUPPORT_PREVIOUS_TRACK,
+    SUPPORT_NEXT_TRACK,
+    SUPPORT_STOP,
+    SUPPORT_VOLUME_SET,
+    SUPPORT_PLAY,
+    SUPPORT_PLAY_MEDIA,
+    SUPPORT_TURN_OFF,
+    SUPPORT_TURN_ON,
+    SUPPORT_VOLUME_MUTE,
+    SUPPORT_SELECT_SOURCE,
+    SUPPORT_SHUFFLE_SET,
+)
+SUPPORT_ALEXA = reduce(or_, _SUPPORT_FLAGS)
+_PUSH_STATE_COMMANDS = frozenset(
+    {"PUSH_AUDIO_PLAYER_STATE", "PUSH_MEDIA_CHANGE", "PUSH_MEDIA_PROGRESS_CHANGE"}
 )
+_TTS_NOT_SUPPORTED = (
+    "Sorry, text to speech can only be called"
+    " with the notify.alexa_media service."
+    " Please see the alexa_media wiki for details."
+)
+# Alexa player states reported by Amazon mapped to Home Assistant states
+_STATE_MAP = {"PLAYING": STATE_PLAYING, "PAUSED": STATE_PAUSED, "IDLE": STATE_IDLE}
+_ACTIVE_STATES = frozenset({STATE_IDLE, STATE_PAUSED, STATE_PLAYING})
+_MEDIA_LOADED_STATES = frozenset({STATE_PAUSED, STATE_PLAYING})
+# Maps each dispatched event key to a getter for the device serial it targets
+_EVENT_SERIAL_EXTRACTORS = {
+    "last_called_change": lambda data: data["serialNumber"],
+    "bluetooth_change": lambda data: data["deviceSerialNumber"],
+    "player_state": lambda data: data["dopplerId"]["deviceSerialNumber"],
+    "queue_state": lambda data: data["dopplerId"]["deviceSerialNumber"],
+    "push_activity": lambda data: data.get("key", {}).get("serialNumber"),
+}
 _LOGGER = logging.getLogger(__name__)
 
 DEPENDENCIES = [ALEXA_DOMAIN]
 
 
+def _has_push_state_updates(account_data) -> bool:
+    """Return whether the websocket is delivering player state pushes."""
+    seen_commands = account_data.get("websocket_commands")
+    return bool(
+        account_data.get("websocket")
+        and seen_commands
+        and not seen_commands.keys().isdisjoint(_PUSH_STATE_COMMANDS)
+    )
+
+
 # @retry_async(limit=5, delay=2, catch_exceptions=True)
 async def async_setup_platform(hass, config, add_devices_callback, discovery_info=None):
     # pylint: disable=unused-argument
@@ -119,6 +153,36 @@ async def async_setup_platform(hass, config, add_devices_callback, discovery_inf
                 alexa_client,
             )
     result = await add_devices(hide_email(account), devices, add_devices_callback)
+    if result and not account_dict.get("media_player_poll"):
+
+        async def _async_poll_playing(_now):
+            """Refresh every playing media player that asked to be polled."""
+            due = []
+            for entity in account_dict["entities"]["media_player"].values():
+                if entity.play_poll_pending:
+                    entity.play_poll_pending = False
+                    if entity.state == STATE_PLAYING:
+                        due.append(entity)
+            if due:
+                results = await asyncio.gather(
+                    *(
+                        entity.async_update_ha_state(force_refresh=True)
+                        for entity in due
+                    ),
+                    return_exceptions=True,
+                )
+                for entity, result in zip(due, results):
+                    if isinstance(result, Exception):
+                        _LOGGER.error(
+                            "%s: Play poll of %s failed",
+                            hide_email(account),
+                            entity,
+                            exc_info=result,
+                        )
+
+        account_dict["media_player_poll"] = async_track_time_interval(
+            hass, _async_poll_playing, timedelta(seconds=PLAY_SCAN_INTERVAL)
+        )
     if result and entry_setup:
         _LOGGER.debug("Detected config entry already setup, using load platform")
         for component in DEPENDENT_ALEXA_COMPONENTS:
@@ -178,6 +242,9 @@ async def async_unload_entry(hass, entry) -> bool:
     account = entry.data[CONF_EMAIL]
     _LOGGER.debug("%s: Attempting to unload media players", hide_email(account))
     account_dict = hass.data[DATA_ALEXAMEDIA]["accounts"][account]
+    cancel_poll = account_dict.pop("media_player_poll", None)
+    if cancel_poll:
+        cancel_poll()
     for device in account_dict["entities"]["media_player"].values():
         _LOGGER.debug("%s: Removing %s", hide_email(account), device)
         await device.async_remove()
@@ -191,6 +258,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         # pylint: disable=unused-argument
         """Initialize the Alexa device."""
         super().__init__(self, login)
+        self._hidden_email = hide_email(login.email)
 
         # Logged in info
         self._authenticated = None
@@ -203,10 +271,13 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         self._device = device
         self._device_name = None
         self._device_serial_number = None
+        self._hidden_serial = None
         self._device_type = None
         self._device_family = None
+        self._model_str = None
         self._device_owner_customer_id = None
         self._software_version = None
+        self._device_info = None
         self._available = None
         self._assumed_state = False
         self._capabilities = []
@@ -216,6 +287,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         self._session = None
         self._media_duration = None
         self._media_image_url = None
+        self._media_image_url_escaped = None
         self._media_title = None
         self._media_pos = None
         self._media_album_name = None
@@ -239,13 +311,21 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         self._dnd = None
         # Polling state
         self._should_poll = True
-        self._last_update = util.utcnow()
+        self.play_poll_pending = False
+        self._last_update = None
+        self._last_update_ts = None
         self._listener = None
+        self._pending_update_cancel = None
+        self._pending_refresh_cancel = None
+        self._write_handle = None
         self._bluetooth_state = None
+        self._source_cache = None
         self._app_device_list = None
+        self._app_device_serials = frozenset()
         self._parent_clusters = None
         self._timezone = None
         self._second_account_index = second_account_index
+        self._account_dict = {}
 
     async def init(self, device):
         """Initialize."""
@@ -253,18 +333,18 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
 
     async def async_added_to_hass(self):
         """Perform tasks after loading."""
+        self._account_dict = self.hass.data[DATA_ALEXAMEDIA]["accounts"][
+            self._login.email
+        ]
         # Register event handler on bus
         await self.refresh(self._device)
         self._listener = async_dispatcher_connect(
             self.hass,
-            f"{ALEXA_DOMAIN}_{hide_email(self._login.email)}"[0:32],
+            f"{ALEXA_DOMAIN}_{self._hidden_email}"[0:32],
             self._handle_event,
         )
         # Register to coordinator:
-        email = self._login.email
-        coordinator = self.hass.data[DATA_ALEXAMEDIA]["accounts"][email].get(
-            "coordinator"
-        )
+        coordinator = self._account_dict.get("coordinator")
         if coordinator:
             coordinator.async_add_listener(self.update)
 
@@ -272,10 +352,16 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         """Prepare to remove entity."""
         # Register event handler on bus
         self._listener()
-        email = self._login.email
-        coordinator = self.hass.data[DATA_ALEXAMEDIA]["accounts"][email].get(
-            "coordinator"
-        )
+        if self._pending_update_cancel:
+            self._pending_update_cancel()
+            self._pending_update_cancel = None
+        if self._pending_refresh_cancel:
+            self._pending_refresh_cancel()
+            self._pending_refresh_cancel = None
+        if self._write_handle:
+            self._write_handle.cancel()
+            self._write_handle = None
+        coordinator = self._account_dict.get("coordinator")
         if coordinator:
             coordinator.async_remove_listener(self.update)
 
@@ -294,216 +380,242 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         The difference between self.update and self.schedule_update_ha_state
         is self.update will pull data from Amazon, while schedule_update
         assumes the MediaClient state is already updated.
+        Each _on_<key> handler returns None if it left the state untouched,
+        otherwise whether the single state write at the end should force a
+        refresh from Amazon.
         """
-
-        async def _refresh_if_no_audiopush(already_refreshed=False):
-            email = self._login.email
-            seen_commands = (
-                self.hass.data[DATA_ALEXAMEDIA]["accounts"][email][
-                    "websocket_commands"
-                ].keys()
-                if "websocket_commands"
-                in (self.hass.data[DATA_ALEXAMEDIA]["accounts"][email])
-                else None
-            )
-            if (
-                not already_refreshed
-                and seen_commands
-                and not (
-                    "PUSH_AUDIO_PLAYER_STATE" in seen_commands
-                    or "PUSH_MEDIA_CHANGE" in seen_commands
-                    or "PUSH_MEDIA_PROGRESS_CHANGE" in seen_commands
-                )
-            ):
-                # force refresh if player_state update not found, see #397
-                _LOGGER.debug(
-                    "%s: No PUSH_AUDIO_PLAYER_STATE/"
-                    "PUSH_MEDIA_CHANGE/PUSH_MEDIA_PROGRESS_CHANGE in %s;"
-                    "forcing refresh",
-                    hide_email(email),
-                    seen_commands,
-                )
-                await self.async_update()
-
         try:
             if not self.enabled:
                 return
         except AttributeError:
             pass
-        already_refreshed = False
-        event_serial = None
-        if "last_called_change" in event:
-            event_serial = (
-                event["last_called_change"]["serialNumber"]
-                if event["last_called_change"]
-                else None
-            )
-        elif "bluetooth_change" in event:
-            event_serial = (
-                event["bluetooth_change"]["deviceSerialNumber"]
-                if event["bluetooth_change"]
-                else None
-            )
-        elif "player_state" in event:
-            event_serial = (
-                event["player_state"]["dopplerId"]["deviceSerialNumber"]
-                if event["player_state"]
-                else None
-            )
-        elif "queue_state" in event:
-            event_serial = (
-                event["queue_state"]["dopplerId"]["deviceSerialNumber"]
-                if event["queue_state"]
-                else None
-            )
-        elif "push_activity" in event:
-            event_serial = (
-                event.get("push_activity", {}).get("key", {}).get("serialNumber")
-            )
+        email = self._login.email
+        account_data = self.hass.data[DATA_ALEXAMEDIA]["accounts"].get(email)
+        if not account_data:
+            return
+        for key, get_serial in _EVENT_SERIAL_EXTRACTORS.items():
+            if key in event:
+                break
+        else:
+            return
+        payload = event[key]
+        event_serial = get_serial(payload) if payload else None
         if not event_serial:
             return
+        dirty = False
         if event_serial == self.device_serial_number:
+            dirty = not self._available
             self._available = True
-            self.async_write_ha_state()
-        if "last_called_change" in event:
-            if (
-                event_serial == self.device_serial_number
-                or any(
-                    item["serialNumber"] == event_serial
-                    for item in self._app_device_list
-                )
-                and self._last_called_timestamp
-                != event["last_called_change"]["timestamp"]
-            ):
+        elif key != "last_called_change" or not (
+            # the new last_called device, the one losing it, or every device
+            # while polling so the whole account refreshes
+            event_serial in self._app_device_serials
+            or self._last_called
+            or not account_data["websocket"]
+        ):
+            return
+        force_refresh = await self._EVENT_HANDLERS[key](
+            self, event_serial, payload, account_data
+        )
+        if force_refresh:
+            self.async_schedule_update_ha_state(force_refresh=True)
+        elif dirty or force_refresh is not None:
+            self._schedule_write_ha_state()
+
+    def _missing_audiopush(self, account_data):
+        """Return whether player state must be polled for lack of pushes."""
+        seen_commands = account_data.get("websocket_commands")
+        if seen_commands and seen_commands.keys().isdisjoint(_PUSH_STATE_COMMANDS):
+            # force refresh if player_state update not found, see #397
+            _LOGGER.debug(
+                "%s: No PUSH_AUDIO_PLAYER_STATE/"
+                "PUSH_MEDIA_CHANGE/PUSH_MEDIA_PROGRESS_CHANGE in %s;"
+                "forcing refresh",
+                self._hidden_email,
+                seen_commands.keys(),
+            )
+            return True
+        return False
 
-                _LOGGER.debug(
-                    "%s: %s is last_called: %s",
-                    hide_email(self._login.email),
-                    self,
-                    hide_serial(self.device_serial_number),
-                )
-                self._last_called = True
-                self._last_called_timestamp = event["last_called_change"]["timestamp"]
-                self._last_called_summary = event["last_called_change"].get("summary")
-                if self.hass and self.async_write_ha_state:
-                    self.async_write_ha_state()
-                await self._update_notify_targets()
-            else:
-                self._last_called = False
-            if self.hass and self.async_schedule_update_ha_state:
-                email = self._login.email
-                force_refresh = not (
-                    self.hass.data[DATA_ALEXAMEDIA]["accounts"][email]["websocket"]
-                )
-                self.async_schedule_update_ha_state(force_refresh=force_refresh)
-        elif "bluetooth_change" in event:
-            if event_serial == self.device_serial_number:
-                _LOGGER.debug(
-                    "%s: %s bluetooth_state update: %s",
-                    hide_email(self._login.email),
-                    self.name,
-                    hide_serial(event["bluetooth_change"]),
-                )
-                self._bluetooth_state = event["bluetooth_change"]
-                # the setting of bluetooth_state is not consistent as this
-                # takes from the event instead of the hass storage. We're
-                # setting the value twice. Architectually we should have a
-                # single authoritative source of truth.
-                self._source = self._get_source()
-                self._source_list = self._get_source_list()
-                self._connected_bluetooth = self._get_connected_bluetooth()
-                self._bluetooth_list = self._get_bluetooth_list()
-                if self.hass and self.async_write_ha_state:
-                    self.async_write_ha_state()
-        elif "player_state" in event:
-            player_state = event["player_state"]
-            if event_serial == self.device_serial_number:
-                if "audioPlayerState" in player_state:
-                    _LOGGER.debug(
-                        "%s: %s state update: %s",
-                        hide_email(self._login.email),
-                        self.name,
-                        player_state["audioPlayerState"],
-                    )
-                    # allow delay before trying to refresh to avoid http 400 errors
-                    await asyncio.sleep(2)
-                    await self.async_update()
-                    already_refreshed = True
-                elif "mediaReferenceId" in player_state:
-                    _LOGGER.debug(
-                        "%s: %s media update: %s",
-                        hide_email(self._login.email),
-                        self.name,
-                        player_state["mediaReferenceId"],
-                    )
-                    await self.async_update()
-                    already_refreshed = True
-                elif "volumeSetting" in player_state:
-                    _LOGGER.debug(
-                        "%s: %s volume updated: %s",
-                        hide_email(self._login.email),
-                        self.name,
-                        player_state["volumeSetting"],
-                    )
-                    self._media_vol_level = player_state["volumeSetting"] / 100
-                    if self.hass and self.async_write_ha_state:
-                        self.async_write_ha_state()
-                elif "dopplerConnectionState" in player_state:
-                    self.available = player_state["dopplerConnectionState"] == "ONLINE"
-                    if self.hass and self.async_write_ha_state:
-                        self.async_write_ha_state()
-                await _refresh_if_no_audiopush(already_refreshed)
-        elif "push_activity" in event:
-            if self.state in {STATE_IDLE, STATE_PAUSED, STATE_PLAYING}:
-                _LOGGER.debug(
-                    "%s: %s checking for potential state update due to push activity on %s",
-                    hide_email(self._login.email),
-                    self.name,
-                    hide_serial(event_serial),
-                )
-                # allow delay before trying to refresh to avoid http 400 errors
-                await asyncio.sleep(2)
-                await self.async_update()
-                already_refreshed = True
-        if "queue_state" in event:
-            queue_state = event["queue_state"]
-            if event_serial == self.device_serial_number:
-                if (
-                    "trackOrderChanged" in queue_state
-                    and not queue_state["trackOrderChanged"]
-                    and "loopMode" in queue_state
-                ):
-                    self._repeat = queue_state["loopMode"] == "LOOP_QUEUE"
-                    _LOGGER.debug(
-                        "%s: %s repeat updated to: %s %s",
-                        hide_email(self._login.email),
-                        self.name,
-                        self._repeat,
-                        queue_state["loopMode"],
-                    )
-                elif "playBackOrder" in queue_state:
-                    self._shuffle = queue_state["playBackOrder"] == "SHUFFLE_ALL"
-                    _LOGGER.debug(
-                        "%s: %s shuffle updated to: %s %s",
-                        hide_email(self._login.email),
-                        self.name,
-                        self._shuffle,
-                        queue_state["playBackOrder"],
-                    )
-                await _refresh_if_no_audiopush(already_refreshed)
+    @callback
+    def _schedule_write_ha_state(self):
+        """Write the state on the next loop iteration.
+
+        Several writes requested within the same iteration, such as a refresh
+        followed by the write at the end of async_update, result in one write.
+        """
+        if self._write_handle is None:
+            self._write_handle = self.hass.loop.call_soon(
+                self._async_write_scheduled_state
+            )
+
+    @callback
+    def _async_write_scheduled_state(self):
+        """Write the state requested by _schedule_write_ha_state."""
+        self._write_handle = None
+        self.async_write_ha_state()
+
+    def _schedule_coalesced_update(self, delay=2):
+        """Schedule a delayed update unless one is already pending.
+
+        Push events arriving within delay seconds of the first share its
+        refresh, so a burst never postpones the update past delay.
+        """
+        if self._pending_update_cancel:
+            return
+        self._pending_update_cancel = async_call_later(
+            self.hass, delay, self._async_pending_update
+        )
+
+    async def _async_pending_update(self, *_):
+        """Run the update scheduled by _schedule_coalesced_update."""
+        self._pending_update_cancel = None
+        await self.async_update(force=True)
+
+    async def _on_last_called_change(self, event_serial, last_called, account_data):
+        if (
+            event_serial == self.device_serial_number
+            or event_serial in self._app_device_serials
+            and self._last_called_timestamp != last_called["timestamp"]
+        ):
+
+            _LOGGER.debug(
+                "%s: %s is last_called: %s",
+                self._hidden_email,
+                self,
+                self._hidden_serial,
+            )
+            self._last_called = True
+            self._last_called_timestamp = last_called["timestamp"]
+            self._last_called_summary = last_called.get("summary")
+            # publish last_called now; updating notify targets takes seconds
+            self._schedule_write_ha_state()
+            await self._update_notify_targets()
+        else:
+            self._last_called = False
+        return not account_data["websocket"]
+
+    async def _on_bluetooth_change(self, event_serial, bluetooth_state, account_data):
+        # pylint: disable=unused-argument
+        if event_serial == self.device_serial_number:
+            _LOGGER.debug(
+                "%s: %s bluetooth_state update: %s",
+                self._hidden_email,
+                self.name,
+                hide_serial(bluetooth_state),
+            )
+            self._bluetooth_state = bluetooth_state
+            # the setting of bluetooth_state is not consistent as this
+            # takes from the event instead of the hass storage. We're
+            # setting the value twice. Architectually we should have a
+            # single authoritative source of truth.
+            self._source = self._get_source()
+            self._source_list = self._get_source_list()
+            self._connected_bluetooth = self._get_connected_bluetooth()
+            self._bluetooth_list = self._get_bluetooth_list()
+            return False
+        return None
+
+    async def _on_player_state(self, event_serial, player_state, account_data):
+        if event_serial != self.device_serial_number:
+            return None
+        needs_refresh = False
+        changed = None
+        if "audioPlayerState" in player_state:
+            _LOGGER.debug(
+                "%s: %s state update: %s",
+                self._hidden_email,
+                self.name,
+                player_state["audioPlayerState"],
+            )
+            needs_refresh = True
+        elif "mediaReferenceId" in player_state:
+            _LOGGER.debug(
+                "%s: %s media update: %s",
+                self._hidden_email,
+                self.name,
+                player_state["mediaReferenceId"],
+            )
+            needs_refresh = True
+        elif "volumeSetting" in player_state:
+            _LOGGER.debug(
+                "%s: %s volume updated: %s",
+                self._hidden_email,
+                self.name,
+                player_state["volumeSetting"],
+            )
+            self._media_vol_level = player_state["volumeSetting"] / 100
+            self._media_is_muted = self._media_vol_level == 0
+            changed = False
+        elif "dopplerConnectionState" in player_state:
+            self.available = player_state["dopplerConnectionState"] == "ONLINE"
+            changed = False
+        if needs_refresh or self._missing_audiopush(account_data):
+            # allow delay before trying to refresh to avoid http 400 errors
+            self._schedule_coalesced_update()
+        return changed
+
+    async def _on_push_activity(self, event_serial, push_activity, account_data):
+        # pylint: disable=unused-argument
+        if self.state in _ACTIVE_STATES:
+            _LOGGER.debug(
+                "%s: %s checking for potential state update due to push activity on %s",
+                self._hidden_email,
+                self.name,
+                hide_serial(event_serial),
+            )
+            # allow delay before trying to refresh to avoid http 400 errors
+            self._schedule_coalesced_update()
+
+    async def _on_queue_state(self, event_serial, queue_state, account_data):
+        if event_serial != self.device_serial_number:
+            return None
+        changed = None
+        if not queue_state.get("trackOrderChanged", True) and "loopMode" in queue_state:
+            self._repeat = queue_state["loopMode"] == "LOOP_QUEUE"
+            _LOGGER.debug(
+                "%s: %s repeat updated to: %s %s",
+                self._hidden_email,
+                self.name,
+                self._repeat,
+                queue_state["loopMode"],
+            )
+            changed = False
+        elif "playBackOrder" in queue_state:
+            self._shuffle = queue_state["playBackOrder"] == "SHUFFLE_ALL"
+            _LOGGER.debug(
+                "%s: %s shuffle updated to: %s %s",
+                self._hidden_email,
+                self.name,
+                self._shuffle,
+                queue_state["playBackOrder"],
+            )
+            changed = False
+        if self._missing_audiopush(account_data):
+            self._schedule_coalesced_update()
+        return changed
+
+    _EVENT_HANDLERS = {
+        "last_called_change": _on_last_called_change,
+        "bluetooth_change": _on_bluetooth_change,
+        "player_state": _on_player_state,
+        "queue_state": _on_queue_state,
+        "push_activity": _on_push_activity,
+    }
 
     def _clear_media_details(self):
         """Set all Media Items to None."""
         # General
         self._media_duration = None
         self._media_image_url = None
+        self._media_image_url_escaped = None
         self._media_title = None
         self._media_pos = None
         self._media_album_name = None
         self._media_artist = None
         self._media_player_state = None
-        self._media_is_muted = None
         # volume is also used for announce/tts so state should remain
+        # self._media_is_muted = None
         # self._media_vol_level = None
 
     def _set_authentication_details(self, auth):
@@ -534,20 +646,31 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             self._device_name = device["accountName"]
             self._device_family = device["deviceFamily"]
             self._device_type = device["deviceType"]
+            self._model_str = f"{self._device_family} {self._device_type}"
             self._device_serial_number = device["serialNumber"]
+            self._hidden_serial = hide_serial(self._device_serial_number)
             self._app_device_list = device["appDeviceList"]
+            self._app_device_serials = frozenset(
+                item["serialNumber"] for item in self._app_device_list or ()
+            )
             self._device_owner_customer_id = device["deviceOwnerCustomerId"]
             self._software_version = device["softwareVersion"]
+            self._device_info = None
             self._available = device["online"]
             self._capabilities = device["capabilities"]
             self._cluster_members = device["clusterMembers"]
             self._parent_clusters = device["parentClusters"]
             self._bluetooth_state = device.get("bluetooth_state", {})
-            self._locale = device["locale"] if "locale" in device else "en-US"
-            self._timezone = device["timeZoneId"] if "timeZoneId" in device else "UTC"
-            self._dnd = device["dnd"] if "dnd" in device else None
+            self._locale = device.get("locale", "en-US")
+            self._timezone = device.get("timeZoneId", "UTC")
+            self._dnd = device.get("dnd")
             self._set_authentication_details(device["auth_info"])
         session = None
+        account_data = (
+            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]
+            if self.hass
+            else {}
+        )
         if self.available:
             _LOGGER.debug("%s: Refreshing %s", self.account, self)
             self._assumed_state = False
@@ -559,32 +682,21 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             new_last_called = self._get_last_called()
             if new_last_called and self._last_called != new_last_called:
                 self._last_called = new_last_called
-                self._last_called_timestamp = self.hass.data[DATA_ALEXAMEDIA][
-                    "accounts"
-                ][self._login.email]["last_called"]["timestamp"]
-                self._last_called_summary = self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                    self._login.email
-                ]["last_called"].get("summary")
+                self._last_called_timestamp = account_data["last_called"]["timestamp"]
+                self._last_called_summary = account_data["last_called"].get("summary")
                 await self._update_notify_targets()
             if skip_api and self.hass:
-                self.async_write_ha_state()
+                self._schedule_write_ha_state()
                 return
             if "MUSIC_SKILL" in self._capabilities:
                 if self._parent_clusters and self.hass:
-                    playing_parents = list(
-                        filter(
-                            lambda x: (
-                                self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    self._login.email
-                                ]["entities"]["media_player"].get(x)
-                                and self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    self._login.email
-                                ]["entities"]["media_player"][x].state
-                                == STATE_PLAYING
-                            ),
-                            self._parent_clusters,
-                        )
-                    )
+                    mp_entities = account_data["entities"]["media_player"]
+                    playing_parents = [
+                        parent
+                        for x in self._parent_clusters
+                        if (parent := mp_entities.get(x)) is not None
+                        and parent.state == STATE_PLAYING
+                    ]
                 else:
                     playing_parents = []
                 parent_session = {}
@@ -593,123 +705,98 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                         _LOGGER.warning(
                             "Found multiple playing parents " "please file an issue"
                         )
-                    parent = self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                        self._login.email
-                    ]["entities"]["media_player"][playing_parents[0]]
+                    parent = playing_parents[0]
                     self._playing_parent = parent
                     parent_session = parent.session
                 if parent_session:
                     session = parent_session.copy()
                     session["isPlayingInLemur"] = False
                     session["lemurVolume"] = None
-                    session["volume"] = (
-                        parent_session["lemurVolume"]["memberVolume"][
-                            self.device_serial_number
-                        ]
-                        if parent_session.get("lemurVolume")
-                        and parent_session.get("lemurVolume", {})
-                        .get("memberVolume", {})
-                        .get(self.device_serial_number)
-                        else session["volume"]
+                    lemur_volume = parent_session.get("lemurVolume") or {}
+                    member_volume = (lemur_volume.get("memberVolume") or {}).get(
+                        self._device_serial_number
                     )
+                    if member_volume:
+                        session["volume"] = member_volume
                     session = {"playerInfo": session}
                 else:
                     self._playing_parent = None
-                    session = await self.alexa_api.get_state()
+                    session = await self._api_call(self.alexa_api.get_state())
         self._clear_media_details()
         # update the session if it exists
         self._session = session if session else None
         if self._session and self._session.get("playerInfo"):
             self._session = self._session["playerInfo"]
-            if self._session.get("transport"):
-                self._shuffle = (
-                    self._session["transport"]["shuffle"] == "SELECTED"
-                    if (
-                        "shuffle" in self._session["transport"]
-                        and self._session["transport"]["shuffle"] != "DISABLED"
-                    )
-                    else None
-                )
-                self._repeat = (
-                    self._session["transport"]["repeat"] == "SELECTED"
-                    if (
-                        "repeat" in self._session["transport"]
-                        and self._session["transport"]["repeat"] != "DISABLED"
-                    )
-                    else None
-                )
+            transport = self._session.get("transport")
+            if transport:
+                shuffle = transport.get("shuffle", "DISABLED")
+                repeat = transport.get("repeat", "DISABLED")
+                self._shuffle = shuffle == "SELECTED" if shuffle != "DISABLED" else None
+                self._repeat = repeat == "SELECTED" if repeat != "DISABLED" else None
             if self._session.get("state"):
+                info_text = self._session.get("infoText") or {}
+                main_art = self._session.get("mainArt") or {}
+                progress = self._session.get("progress") or {}
+                volume = self._session.get("volume") or {}
+                lemur_volume = self._session.get("lemurVolume")
                 self._media_player_state = self._session["state"]
-                self._media_title = self._session.get("infoText", {}).get("title")
-                self._media_artist = self._session.get("infoText", {}).get("subText1")
-                self._media_album_name = self._session.get("infoText", {}).get(
-                    "subText2"
-                )
-                self._media_image_url = (
-                    self._session.get("mainArt", {}).get("url")
-                    if self._session.get("mainArt")
-                    else None
-                )
-                self._media_pos = (
-                    self._session.get("progress", {}).get("mediaProgress")
-                    if self._session.get("progress")
-                    else None
-                )
-                self._media_duration = (
-                    self._session.get("progress", {}).get("mediaLength")
-                    if self._session.get("progress")
+                self._media_title = info_text.get("title")
+                self._media_artist = info_text.get("subText1")
+                self._media_album_name = info_text.get("subText2")
+                self._media_image_url = main_art.get("url")
+                # fix failure of HA media player ui to quote "(" or ")"
+                self._media_image_url_escaped = (
+                    self._media_image_url.replace("(", "%28").replace(")", "%29")
+                    if self._media_image_url
                     else None
                 )
-                if not self._session.get("lemurVolume"):
-                    self._media_is_muted = (
-                        self._session.get("volume", {}).get("muted")
-                        if self._session.get("volume")
-                        else self._media_is_muted
-                    )
+                self._media_pos = progress.get("mediaProgress")
+                self._media_duration = progress.get("mediaLength")
+                if not lemur_volume:
                     self._media_vol_level = (
-                        self._session["volume"]["volume"] / 100
-                        if self._session.get("volume")
-                        and self._session.get("volume", {}).get("volume")
+                        volume["volume"] / 100
+                        if volume.get("volume")
                         else self._media_vol_level
                     )
+                    muted = volume.get("muted")
                 else:
-                    self._media_is_muted = (
-                        self._session.get("lemurVolume", {})
-                        .get("compositeVolume", {})
-                        .get("muted")
-                    )
+                    composite_volume = lemur_volume.get("compositeVolume") or {}
                     self._media_vol_level = (
-                        self._session["lemurVolume"]["compositeVolume"]["volume"] / 100
-                        if (
-                            self._session.get("lemurVolume", {})
-                            .get("compositeVolume", {})
-                            .get("volume")
-                        )
+                        composite_volume["volume"] / 100
+                        if composite_volume.get("volume")
                         else self._media_vol_level
                     )
+                    muted = composite_volume.get("muted")
+                # mute is emulated with a volume of 0, see async_mute_volume
+                self._media_is_muted = bool(muted) or self._media_vol_level == 0
                 if self.hass and self._session.get("isPlayingInLemur"):
-                    asyncio.gather(
-                        *map(
-                            lambda x: (
-                                self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                    self._login.email
-                                ]["entities"]["media_player"][x].async_update()
-                            ),
-                            filter(
-                                lambda x: (
-                                    self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                        self._login.email
-                                    ]["entities"]["media_player"].get(x)
-                                    and self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                                        self._login.email
-                                    ]["entities"]["media_player"][x].available
-                                ),
-                                self._cluster_members,
-                            ),
+                    mp_entities = account_data["entities"]["media_player"]
+                    members = [
+                        member
+                        for x in self._cluster_members
+                        if (member := mp_entities.get(x)) and member.available
+                    ]
+                    if members:
+                        # the parent refresh itself signals that members changed
+                        results = await asyncio.gather(
+                            *(member.async_update(force=True) for member in members),
+                            return_exceptions=True,
                         )
-                    )
+                        for member, result in zip(members, results):
+                            if isinstance(result, Exception):
+                                _LOGGER.warning(
+                                    "%s: %s failed to update group member %s",
+                                    self._hidden_email,
+                                    self.name,
+                                    member,
+                                    exc_info=result,
+                                )
         if self.hass:
-            self.async_write_ha_state()
+            self._schedule_write_ha_state()
+
+    def _websocket_active(self):
+        """Return whether the account websocket is connected."""
+        return bool(self._account_dict.get("websocket"))
 
     @property
     def source(self):
@@ -726,43 +813,56 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         """Select input source."""
         if source == "Local Speaker":
             if self.hass:
-                self.hass.async_create_task(self.alexa_api.disconnect_bluetooth())
+                self.hass.async_create_task(
+                    self._api_call(self.alexa_api.disconnect_bluetooth())
+                )
             else:
-                await self.alexa_api.disconnect_bluetooth()
+                await self._api_call(self.alexa_api.disconnect_bluetooth())
             self._source = "Local Speaker"
         elif self._bluetooth_state.get("pairedDeviceList"):
             for devices in self._bluetooth_state["pairedDeviceList"]:
                 if devices["friendlyName"] == source:
                     if self.hass:
                         self.hass.async_create_task(
-                            self.alexa_api.set_bluetooth(devices["address"])
+                            self._api_call(
+                                self.alexa_api.set_bluetooth(devices["address"])
+                            )
                         )
                     else:
-                        await self.alexa_api.set_bluetooth(devices["address"])
+                        await self._api_call(
+                            self.alexa_api.set_bluetooth(devices["address"])
+                        )
                     self._source = source
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+        if not self._websocket_active():
             await self.async_update()
 
-    def _get_source(self):
+    def _get_bluetooth_sources(self):
+        """Return the source and source list for the current bluetooth state.
+
+        Bluetooth state is replaced rather than mutated on updates, so the
+        result is cached until a new state object is stored.
+        """
+        if self._source_cache and self._source_cache[0] is self._bluetooth_state:
+            return self._source_cache[1:]
+        paired_devices = self._bluetooth_state.get("pairedDeviceList") or []
+        source_list = ["Local Speaker"] + [
+            device["friendlyName"]
+            for device in paired_devices
+            if device["profiles"] and "A2DP-SOURCE" in device["profiles"]
+        ]
         source = "Local Speaker"
-        if self._bluetooth_state.get("pairedDeviceList"):
-            for device in self._bluetooth_state["pairedDeviceList"]:
-                if (
-                    device["connected"] is True
-                    and device["friendlyName"] in self.source_list
-                ):
-                    return device["friendlyName"]
-        return source
+        for device in paired_devices:
+            if device["connected"] is True and device["friendlyName"] in source_list:
+                source = device["friendlyName"]
+                break
+        self._source_cache = (self._bluetooth_state, source, source_list)
+        return source, source_list
+
+    def _get_source(self):
+        return self._get_bluetooth_sources()[0]
 
     def _get_source_list(self):
-        sources = []
-        if self._bluetooth_state.get("pairedDeviceList"):
-            for devices in self._bluetooth_state["pairedDeviceList"]:
-                if devices["profiles"] and "A2DP-SOURCE" in devices["profiles"]:
-                    sources.append(devices["friendlyName"])
-        return ["Local Speaker"] + sources
+        return self._get_bluetooth_sources()[1]
 
     def _get_connected_bluetooth(self):
         source = None
@@ -794,17 +894,14 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             last_called_serial = None
         _LOGGER.debug(
             "%s: %s: Last_called check: self: %s reported: %s",
-            hide_email(self._login.email),
+            self._hidden_email,
             self._device_name,
-            hide_serial(self._device_serial_number),
+            self._hidden_serial,
             hide_serial(last_called_serial),
         )
         return last_called_serial is not None and (
             self._device_serial_number == last_called_serial
-            or any(
-                item["serialNumber"] == last_called_serial
-                for item in self._app_device_list
-            )
+            or last_called_serial in self._app_device_serials
         )
 
     @property
@@ -855,15 +952,13 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @property
     def state(self):
         """Return the state of the device."""
-        if not self.available:
+        if not self._available:
             return STATE_UNAVAILABLE
-        if self._media_player_state == "PLAYING":
-            return STATE_PLAYING
-        if self._media_player_state == "PAUSED":
-            return STATE_PAUSED
-        if self._media_player_state == "IDLE":
-            return STATE_IDLE
-        return STATE_STANDBY
+        return _STATE_MAP.get(self._media_player_state, STATE_STANDBY)
+
+    def _media_loaded(self):
+        """Return whether the device is available with media playing or paused."""
+        return bool(self._available) and self.state in _MEDIA_LOADED_STATES
 
     def update(self):
         """Get the latest details on a media player synchronously."""
@@ -871,7 +966,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         # return self.hass.add_job(async_update)
 
     @_catch_login_errors
-    async def async_update(self):
+    async def async_update(self, force: bool = False):
         """Get the latest details on a media player.
 
         Because media players spend the majority of time idle, an adaptive
@@ -879,6 +974,11 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         play states. An initial version included an update_devices call on
         every update. However, this quickly floods the network for every new
         device added. This should only call refresh() to call the AlexaAPI.
+
+        Args:
+        force (bool): Whether to refresh even if websocket pushes are
+                      flowing and the last update is recent. Used when a
+                      push event reports the state has changed.
         """
         try:
             if not self.enabled:
@@ -894,84 +994,75 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             self._assumed_state = True
             self.available = False
             return
-        device = self.hass.data[DATA_ALEXAMEDIA]["accounts"][email]["devices"][
-            "media_player"
-        ][self.device_serial_number]
-        seen_commands = (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][email][
-                "websocket_commands"
-            ].keys()
-            if "websocket_commands"
-            in (self.hass.data[DATA_ALEXAMEDIA]["accounts"][email])
-            else None
-        )
+        account_data = self.hass.data[DATA_ALEXAMEDIA]["accounts"][email]
+        push_updates = _has_push_state_updates(account_data)
+        if (
+            not force
+            and push_updates
+            and self._last_update_ts is not None
+            and time.monotonic() - self._last_update_ts < PLAY_SCAN_INTERVAL
+        ):
+            _LOGGER.debug(
+                "%s: %s skipping update; websocket pushes are current",
+                self._hidden_email,
+                self.name,
+            )
+            return
+        device = account_data["devices"]["media_player"][self.device_serial_number]
         await self.refresh(  # pylint: disable=unexpected-keyword-arg
             device, no_throttle=True
         )
-        websocket_enabled = (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"].get(email, {}).get("websocket")
-        )
-        if (
-            self.state in [STATE_PLAYING]
-            and
-            #  only enable polling if websocket not connected
-            (
-                not websocket_enabled
-                or not seen_commands
-                or not (
-                    "PUSH_AUDIO_PLAYER_STATE" in seen_commands
-                    or "PUSH_MEDIA_CHANGE" in seen_commands
-                    or "PUSH_MEDIA_PROGRESS_CHANGE" in seen_commands
-                )
-            )
-        ):
+        websocket_enabled = account_data.get("websocket")
+        #  only enable polling if websocket not connected
+        if self.state == STATE_PLAYING and not push_updates:
             self._should_poll = False  # disable polling since manual update
-            if (
-                self._last_update == 0
-                or util.dt.as_timestamp(util.utcnow())
-                - util.dt.as_timestamp(self._last_update)
-                > PLAY_SCAN_INTERVAL
-            ):
+            if not self.play_poll_pending:
                 _LOGGER.debug(
-                    "%s: %s playing; scheduling update in %s seconds",
-                    hide_email(self._login.email),
+                    "%s: %s playing; queuing for the next play poll",
+                    self._hidden_email,
                     self.name,
-                    PLAY_SCAN_INTERVAL,
-                )
-                async_call_later(
-                    self.hass,
-                    PLAY_SCAN_INTERVAL,
-                    lambda _: self.async_schedule_update_ha_state(force_refresh=True),
                 )
+                self.play_poll_pending = True
         elif self._should_poll:  # Not playing, one last poll
             self._should_poll = False
             if not websocket_enabled:
                 _LOGGER.debug(
                     "%s: Disabling polling and scheduling last update in"
                     " 300 seconds for %s",
-                    hide_email(self._login.email),
+                    self._hidden_email,
                     self.name,
                 )
-                async_call_later(
-                    self.hass,
-                    300,
-                    lambda _: self.async_schedule_update_ha_state(force_refresh=True),
-                )
+                self._schedule_forced_refresh(300)
             else:
                 _LOGGER.debug(
                     "%s: Disabling polling for %s",
-                    hide_email(self._login.email),
+                    self._hidden_email,
                     self.name,
                 )
         self._last_update = util.utcnow()
-        self.async_write_ha_state()
+        self._last_update_ts = time.monotonic()
+        self._schedule_write_ha_state()
+
+    def _schedule_forced_refresh(self, delay):
+        """Schedule a forced state refresh, replacing one still pending."""
+        if self._pending_refresh_cancel:
+            self._pending_refresh_cancel()
+        self._pending_refresh_cancel = async_call_later(
+            self.hass, delay, self._async_forced_refresh
+        )
+
+    @callback
+    def _async_forced_refresh(self, _now):
+        """Run the refresh scheduled by _schedule_forced_refresh."""
+        self._pending_refresh_cancel = None
+        self.async_schedule_update_ha_state(force_refresh=True)
 
     @property
     def media_content_type(self):
         """Return the content type of current playing media."""
-        if self.state in [STATE_PLAYING, STATE_PAUSED]:
+        if self._media_loaded():
             return MEDIA_TYPE_MUSIC
-        return STATE_STANDBY
+        return None
 
     @property
     def media_artist(self):
@@ -1001,10 +1092,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @property
     def media_image_url(self) -> Optional[Text]:
         """Return the image URL of current playing media."""
-        if self._media_image_url:
-            return re.sub("\\(", "%28", re.sub("\\)", "%29", self._media_image_url))
-            # fix failure of HA media player ui to quote "(" or ")"
-        return None
+        return self._media_image_url_escaped
 
     @property
     def media_image_remotely_accessible(self):
@@ -1035,9 +1123,9 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     async def async_set_shuffle(self, shuffle):
         """Enable/disable shuffle mode."""
         if self.hass:
-            self.hass.async_create_task(self.alexa_api.shuffle(shuffle))
+            self.hass.async_create_task(self._api_call(self.alexa_api.shuffle(shuffle)))
         else:
-            await self.alexa_api.shuffle(shuffle)
+            await self._api_call(self.alexa_api.shuffle(shuffle))
         self._shuffle = shuffle
 
     @property
@@ -1049,7 +1137,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     def shuffle(self, state):
         """Set the Shuffle state."""
         self._shuffle = state
-        self.async_write_ha_state()
+        self._schedule_write_ha_state()
 
     @property
     def repeat_state(self):
@@ -1060,7 +1148,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     def repeat_state(self, state):
         """Set the Repeat state."""
         self._repeat = state
-        self.async_write_ha_state()
+        self._schedule_write_ha_state()
 
     @property
     def supported_features(self):
@@ -1077,9 +1165,8 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
         else:
             await self.alexa_api.set_volume(volume)
         self._media_vol_level = volume
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+        self._media_is_muted = volume == 0
+        if not self._websocket_active():
             await self.async_update()
 
     @property
@@ -1090,9 +1177,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @property
     def is_volume_muted(self):
         """Return boolean if volume is currently muted."""
-        if self.volume_level == 0:
-            return True
-        return False
+        return bool(self._media_is_muted)
 
     @_catch_login_errors
     async def async_mute_volume(self, mute):
@@ -1125,43 +1210,37 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                     self.hass.async_create_task(self.alexa_api.set_volume(50))
                 else:
                     await self.alexa_api.set_volume(50)
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+        if not self._websocket_active():
             await self.async_update()
 
     @_catch_login_errors
     async def async_media_play(self):
         """Send play command."""
-        if not (self.state in [STATE_PLAYING, STATE_PAUSED] and self.available):
+        if not self._media_loaded():
             return
         if self._playing_parent:
             await self._playing_parent.async_media_play()
         else:
             if self.hass:
-                self.hass.async_create_task(self.alexa_api.play())
+                self.hass.async_create_task(self._api_call(self.alexa_api.play()))
             else:
-                await self.alexa_api.play()
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+                await self._api_call(self.alexa_api.play())
+        if not self._websocket_active():
             await self.async_update()
 
     @_catch_login_errors
     async def async_media_pause(self):
         """Send pause command."""
-        if not (self.state in [STATE_PLAYING, STATE_PAUSED] and self.available):
+        if not self._media_loaded():
             return
         if self._playing_parent:
             await self._playing_parent.async_media_pause()
         else:
             if self.hass:
-                self.hass.async_create_task(self.alexa_api.pause())
+                self.hass.async_create_task(self._api_call(self.alexa_api.pause()))
             else:
-                await self.alexa_api.pause()
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+                await self._api_call(self.alexa_api.pause())
+        if not self._websocket_active():
             await self.async_update()
 
     @_catch_login_errors
@@ -1176,21 +1255,15 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                 self.hass.async_create_task(
                     self.alexa_api.stop(
                         customer_id=self._customer_id,
-                        queue_delay=self.hass.data[DATA_ALEXAMEDIA]["accounts"][
-                            self.email
-                        ]["options"][CONF_QUEUE_DELAY],
+                        queue_delay=self._queue_delay(),
                     )
                 )
             else:
                 await self.alexa_api.stop(
                     customer_id=self._customer_id,
-                    queue_delay=self.hass.data[DATA_ALEXAMEDIA]["accounts"][self.email][
-                        "options"
-                    ][CONF_QUEUE_DELAY],
+                    queue_delay=self._queue_delay(),
                 )
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+        if not self._websocket_active():
             await self.async_update()
 
     @_catch_login_errors
@@ -1217,43 +1290,65 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @_catch_login_errors
     async def async_media_next_track(self):
         """Send next track command."""
-        if not (self.state in [STATE_PLAYING, STATE_PAUSED] and self.available):
+        if not self._media_loaded():
             return
         if self._playing_parent:
             await self._playing_parent.async_media_next_track()
         else:
             if self.hass:
-                self.hass.async_create_task(self.alexa_api.next())
+                self.hass.async_create_task(self._api_call(self.alexa_api.next()))
             else:
-                await self.alexa_api.next()
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+                await self._api_call(self.alexa_api.next())
+        if not self._websocket_active():
             await self.async_update()
 
     @_catch_login_errors
     async def async_media_previous_track(self):
         """Send previous track command."""
-        if not (self.state in [STATE_PLAYING, STATE_PAUSED] and self.available):
+        if not self._media_loaded():
             return
         if self._playing_parent:
             await self._playing_parent.async_media_previous_track()
         else:
             if self.hass:
-                self.hass.async_create_task(self.alexa_api.previous())
+                self.hass.async_create_task(self._api_call(self.alexa_api.previous()))
             else:
-                await self.alexa_api.previous()
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+                await self._api_call(self.alexa_api.previous())
+        if not self._websocket_active():
             await self.async_update()
 
+    def _queue_delay(self):
+        """Return the account queue delay used to batch Alexa commands.
+
+        AlexaAPI queues commands sent within this delay for the same login
+        and runs them as a single sequence.
+        """
+        return self._account_dict.get("options", {}).get(
+            CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY
+        )
+
+    async def _api_call(self, command):
+        """Await a direct AlexaAPI request within the login's concurrency limit.
+
+        The api_sem semaphore is shared by every entity of the login, so a
+        burst of service calls cannot flood Amazon with parallel requests.
+        Commands that go through the AlexaAPI sequence queue must not use
+        this; they sleep for queue_delay before sending and would hold a
+        permit for the whole wait.
+        """
+        api_sem = self._account_dict.get("api_sem")
+        if api_sem is None:
+            return await command
+        async with api_sem:
+            return await command
+
     @_catch_login_errors
     async def async_send_tts(self, message, **kwargs):
         """Send TTS to Device.
 
         NOTE: Does not work on WHA Groups.
         """
+        kwargs.setdefault("queue_delay", self._queue_delay())
         if self.hass:
             self.hass.async_create_task(
                 self.alexa_api.send_tts(
@@ -1268,6 +1363,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @_catch_login_errors
     async def async_send_announcement(self, message, **kwargs):
         """Send announcement to the media player."""
+        kwargs.setdefault("queue_delay", self._queue_delay())
         if self.hass:
             self.hass.async_create_task(
                 self.alexa_api.send_announcement(
@@ -1282,6 +1378,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @_catch_login_errors
     async def async_send_mobilepush(self, message, **kwargs):
         """Send push to the media player's associated mobile devices."""
+        kwargs.setdefault("queue_delay", self._queue_delay())
         if self.hass:
             self.hass.async_create_task(
                 self.alexa_api.send_mobilepush(
@@ -1296,6 +1393,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @_catch_login_errors
     async def async_send_dropin_notification(self, message, **kwargs):
         """Send notification dropin to the media player's associated mobile devices."""
+        kwargs.setdefault("queue_delay", self._queue_delay())
         if self.hass:
             self.hass.async_create_task(
                 self.alexa_api.send_dropin_notification(
@@ -1307,194 +1405,158 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                 message, customer_id=self._customer_id, **kwargs
             )
 
+    def _play_tts_unsupported(self, media_id, queue_delay, **kwargs):
+        # pylint: disable=unused-argument
+        _LOGGER.warning(
+            "%s%s",
+            _TTS_NOT_SUPPORTED,
+            "https://github.com/custom-components/alexa_media_player/wiki/Configuration%3A-Notification-Component#use-the-notifyalexa_media-service",
+        )
+        return self.async_send_tts(_TTS_NOT_SUPPORTED)
+
+    def _play_sequence(self, media_id, queue_delay, **kwargs):
+        _LOGGER.debug(
+            "%s: %s:Running sequence %s with queue_delay %s",
+            self._hidden_email,
+            self,
+            media_id,
+            queue_delay,
+        )
+        return self.alexa_api.send_sequence(
+            media_id,
+            customer_id=self._customer_id,
+            queue_delay=queue_delay,
+            **kwargs,
+        )
+
+    def _play_routine(self, media_id, queue_delay, **kwargs):
+        # pylint: disable=unused-argument
+        _LOGGER.debug(
+            "%s: %s:Running routine %s with queue_delay %s",
+            self._hidden_email,
+            self,
+            media_id,
+            queue_delay,
+        )
+        return self.alexa_api.run_routine(
+            media_id,
+            queue_delay=queue_delay,
+        )
+
+    def _play_sound(self, media_id, queue_delay, **kwargs):
+        _LOGGER.debug(
+            "%s: %s:Playing sound %s with queue_delay %s",
+            self._hidden_email,
+            self,
+            media_id,
+            queue_delay,
+        )
+        return self.alexa_api.play_sound(
+            media_id,
+            customer_id=self._customer_id,
+            queue_delay=queue_delay,
+            **kwargs,
+        )
+
+    def _play_skill(self, media_id, queue_delay, **kwargs):
+        # pylint: disable=unused-argument
+        _LOGGER.debug(
+            "%s: %s:Running skill %s with queue_delay %s",
+            self._hidden_email,
+            self,
+            media_id,
+            queue_delay,
+        )
+        return self.alexa_api.run_skill(
+            media_id,
+            queue_delay=queue_delay,
+        )
+
+    def _play_image(self, media_id, queue_delay, **kwargs):
+        # pylint: disable=unused-argument
+        _LOGGER.debug(
+            "%s: %s:Setting background to %s",
+            self._hidden_email,
+            self,
+            media_id,
+        )
+        return self._api_call(self.alexa_api.set_background(media_id))
+
+    def _play_custom(self, media_id, queue_delay, **kwargs):
+        _LOGGER.debug(
+            '%s: %s:Running custom command: "%s" with queue_delay %s',
+            self._hidden_email,
+            self,
+            media_id,
+            queue_delay,
+        )
+        return self.alexa_api.run_custom(
+            media_id,
+            customer_id=self._customer_id,
+            queue_delay=queue_delay,
+            **kwargs,
+        )
+
+    def _play_music(self, media_type, media_id, queue_delay, **kwargs):
+        _LOGGER.debug(
+            "%s: %s:Playing music %s on %s with queue_delay %s",
+            self._hidden_email,
+            self,
+            media_id,
+            media_type,
+            queue_delay,
+        )
+        return self.alexa_api.play_music(
+            media_type,
+            media_id,
+            customer_id=self._customer_id,
+            queue_delay=queue_delay,
+            timer=kwargs.get("extra", {}).get("timer", None),
+            **kwargs,
+        )
+
+    _MEDIA_HANDLERS = {
+        "music": _play_tts_unsupported,
+        "sequence": _play_sequence,
+        "routine": _play_routine,
+        "sound": _play_sound,
+        "skill": _play_skill,
+        "image": _play_image,
+        "custom": _play_custom,
+    }
+
     @_catch_login_errors
     async def async_play_media(self, media_type, media_id, enqueue=None, **kwargs):
         # pylint: disable=unused-argument
-        """Send the play_media command to the media player."""
-        queue_delay = self.hass.data[DATA_ALEXAMEDIA]["accounts"][self.email][
-            "options"
-        ].get(CONF_QUEUE_DELAY, DEFAULT_QUEUE_DELAY)
-        if media_type == "music":
-            await self.async_send_tts(
-                "Sorry, text to speech can only be called"
-                " with the notify.alexa_media service."
-                " Please see the alexa_media wiki for details."
-            )
-            _LOGGER.warning(
-                "Sorry, text to speech can only be called"
-                " with the notify.alexa_media service."
-                " Please see the alexa_media wiki for details."
-                "https://github.com/custom-components/alexa_media_player/wiki/Configuration%3A-Notification-Component#use-the-notifyalexa_media-service"
-            )
-        elif media_type == "sequence":
-            _LOGGER.debug(
-                "%s: %s:Running sequence %s with queue_delay %s",
-                hide_email(self._login.email),
-                self,
-                media_id,
-                queue_delay,
-            )
-            if self.hass:
-                self.hass.async_create_task(
-                    self.alexa_api.send_sequence(
-                        media_id,
-                        customer_id=self._customer_id,
-                        queue_delay=queue_delay,
-                        **kwargs,
-                    )
-                )
-            else:
-                await self.alexa_api.send_sequence(
-                    media_id,
-                    customer_id=self._customer_id,
-                    queue_delay=queue_delay,
-                    **kwargs,
-                )
-        elif media_type == "routine":
-            _LOGGER.debug(
-                "%s: %s:Running routine %s with queue_delay %s",
-                hide_email(self._login.email),
-                self,
-                media_id,
-                queue_delay,
-            )
-            if self.hass:
-                self.hass.async_create_task(
-                    self.alexa_api.run_routine(
-                        media_id,
-                        queue_delay=queue_delay,
-                    )
-                )
-            else:
-                await self.alexa_api.run_routine(
-                    media_id,
-                    queue_delay=queue_delay,
-                )
-        elif media_type == "sound":
-            _LOGGER.debug(
-                "%s: %s:Playing sound %s with queue_delay %s",
-                hide_email(self._login.email),
-                self,
-                media_id,
-                queue_delay,
-            )
-            if self.hass:
-                self.hass.async_create_task(
-                    self.alexa_api.play_sound(
-                        media_id,
-                        customer_id=self._customer_id,
-                        queue_delay=queue_delay,
-                        **kwargs,
-                    )
-                )
-            else:
-                await self.alexa_api.play_sound(
-                    media_id,
-                    customer_id=self._customer_id,
-                    queue_delay=queue_delay,
-                    **kwargs,
-                )
-        elif media_type == "skill":
-            _LOGGER.debug(
-                "%s: %s:Running skill %s with queue_delay %s",
-                hide_email(self._login.email),
-                self,
-                media_id,
-                queue_delay,
-            )
-            if self.hass:
-                self.hass.async_create_task(
-                    self.alexa_api.run_skill(
-                        media_id,
-                        queue_delay=queue_delay,
-                    )
-                )
-            else:
-                await self.alexa_api.run_skill(
-                    media_id,
-                    queue_delay=queue_delay,
-                )
-        elif media_type == "image":
-            _LOGGER.debug(
-                "%s: %s:Setting background to %s",
-                hide_email(self._login.email),
-                self,
-                media_id,
-            )
-            if self.hass:
-                self.hass.async_create_task(self.alexa_api.set_background(media_id))
-            else:
-                await self.alexa_api.set_background(media_id)
-        elif media_type == "custom":
-            _LOGGER.debug(
-                '%s: %s:Running custom command: "%s" with queue_delay %s',
-                hide_email(self._login.email),
-                self,
-                media_id,
-                queue_delay,
-            )
-            if self.hass:
-                self.hass.async_create_task(
-                    self.alexa_api.run_custom(
-                        media_id,
-                        customer_id=self._customer_id,
-                        queue_delay=queue_delay,
-                        **kwargs,
-                    )
-                )
-            else:
-                await self.alexa_api.run_custom(
-                    media_id,
-                    customer_id=self._customer_id,
-                    queue_delay=queue_delay,
-                    **kwargs,
-                )
+        """Send the play_media command to the media player.
+
+        media_type selects a handler from _MEDIA_HANDLERS; any other type is
+        played as music from that provider.
+        """
+        queue_delay = self._queue_delay()
+        handler = self._MEDIA_HANDLERS.get(media_type)
+        if handler:
+            command = handler(self, media_id, queue_delay, **kwargs)
         else:
-            _LOGGER.debug(
-                "%s: %s:Playing music %s on %s with queue_delay %s",
-                hide_email(self._login.email),
-                self,
-                media_id,
-                media_type,
-                queue_delay,
-            )
-            if self.hass:
-                self.hass.async_create_task(
-                    self.alexa_api.play_music(
-                        media_type,
-                        media_id,
-                        customer_id=self._customer_id,
-                        queue_delay=queue_delay,
-                        timer=kwargs.get("extra", {}).get("timer", None),
-                        **kwargs,
-                    )
-                )
-            else:
-                await self.alexa_api.play_music(
-                    media_type,
-                    media_id,
-                    customer_id=self._customer_id,
-                    queue_delay=queue_delay,
-                    timer=kwargs.get("extra", {}).get("timer", None),
-                    **kwargs,
-                )
-        if not (
-            self.hass.data[DATA_ALEXAMEDIA]["accounts"][self._login.email]["websocket"]
-        ):
+            command = self._play_music(media_type, media_id, queue_delay, **kwargs)
+        if self.hass:
+            self.hass.async_create_task(command)
+        else:
+            await command
+        if not self._websocket_active():
             await self.async_update()
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        attr = {
-            "available": self.available,
+        return {
+            "available": self._available,
             "last_called": self._last_called,
             "last_called_timestamp": self._last_called_timestamp,
             "last_called_summary": self._last_called_summary,
             "connected_bluetooth": self._connected_bluetooth,
             "bluetooth_list": self._bluetooth_list,
         }
-        return attr
 
     @property
     def should_poll(self):
@@ -1504,13 +1566,15 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
     @property
     def device_info(self):
         """Return the device_info of the device."""
-        return {
-            "identifiers": {(ALEXA_DOMAIN, self.unique_id)},
-            "name": self.name,
-            "manufacturer": "Amazon",
-            "model": f"{self._device_family} {self._device_type}",
-            "sw_version": self._software_version,
-        }
+        if self._device_info is None:
+            self._device_info = {
+                "identifiers": {(ALEXA_DOMAIN, self.unique_id)},
+                "name": self.name,
+                "manufacturer": "Amazon",
+                "model": self._model_str,
+                "sw_version": self._software_version,
+            }
+        return self._device_info
 
     async def _update_notify_targets(self) -> None:
         """Update notification service targets."""
@@ -1519,7 +1583,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             if hasattr(notify, "registered_targets"):
                 _LOGGER.debug(
                     "%s: Refreshing notify targets",
-                    hide_email(self._login.email),
+                    self._hidden_email,
                 )
                 await notify.async_register_services()
                 entity_name_last_called = f"{ALEXA_DOMAIN}_last_called{'_'+ self._login.email if self.unique_id[-1:].isdigit() else ''}"
@@ -1531,7 +1595,7 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
                 ):
                     _LOGGER.debug(
                         "%s: Changing notify.targets is not supported by HA version < 2021.2.0; using toggle method",
-                        hide_email(self._login.email),
+                        self._hidden_email,
                     )
                     notify.last_called = False
                     await notify.async_register_services()
@@ -1541,5 +1605,5 @@ class AlexaClient(MediaPlayerDevice, AlexaMedia):
             else:
                 _LOGGER.debug(
                     "%s: Unable to refresh notify targets; notify not ready",
-                    hide_email(self._login.email),
+                    self._hidden_email,
                 )